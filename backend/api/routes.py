@@ -1,19 +1,111 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from database import get_db
-from services.ai_service import AIService
+from database import SessionLocal, get_db
 from services.data_service import DataService
 from models import (
     DashboardResponse,
     RecommendationResponse,
     HistoricalDataResponse,
+    SensorDataPage,
     SensorDataResponse
 )
 from security import validate_field_id, validate_days
-from typing import List
+from single_flight import SingleFlight
+from starlette.concurrency import run_in_threadpool
+from datetime import datetime
+from typing import Optional, Tuple
+import asyncio
+import base64
+import os
 
 router = APIRouter()
 
+# Concurrent identical dashboard/recommendation requests share one computation
+computations = SingleFlight()
+SINGLE_FLIGHT_TIMEOUT = float(os.getenv("SINGLE_FLIGHT_TIMEOUT", "30"))  # seconds
+
+def get_ai_service(db: Session = Depends(get_db)):
+    """Build an AIService, deferring its numpy-heavy import to first use"""
+    from services.ai_service import AIService
+    return AIService(db)
+
+async def coalesce(endpoint: str, field_id: str, db: Session, build):
+    """Run build(db) once for concurrent requests at the same data version.
+
+    build runs in the threadpool with its own session, since the shared
+    result can outlive the request that started it.
+    """
+    def read_version():
+        try:
+            return DataService.get_data_version(db)
+        finally:
+            # Return the connection to the pool while waiting; waiters must not hold one each
+            db.close()
+
+    # The version queries block, so keep them off the event loop too
+    key = (endpoint, field_id, await run_in_threadpool(read_version))
+
+    def compute():
+        session = SessionLocal()
+        try:
+            return build(session)
+        finally:
+            session.close()
+
+    try:
+        return await computations.do(key, compute, timeout=SINGLE_FLIGHT_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Timed out waiting for computation")
+
+def encode_cursor(key: Tuple[datetime, int]) -> str:
+    """Encode a (timestamp, id) keyset position as an opaque cursor"""
+    raw = f"{key[0].isoformat()}|{key[1]}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, row_id = raw.split("|")
+        key = datetime.fromisoformat(timestamp), int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # Stored timestamps are naive UTC; an aware one cannot be compared with them
+    if key[0].tzinfo is not None:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key
+
+def build_dashboard(db: Session, field_id: str) -> DashboardResponse:
+    """Compute dashboard data with current readings and recommendations"""
+    # Get latest sensor data
+    latest_data = DataService.get_latest_sensor_data(db, field_id)
+    if not latest_data:
+        raise HTTPException(status_code=404, detail="No sensor data found for the specified field")
+    
+    # Get recommendations
+    recommendations_data = get_ai_service(db).generate_recommendations(field_id)
+    
+    # Get yield forecast
+    yield_forecast = recommendations_data["yield_forecast"]
+    
+    # Format response
+    return DashboardResponse(
+        current_soil_moisture=latest_data.soil_moisture,
+        current_nutrients={
+            "nitrogen": latest_data.soil_nitrogen,
+            "phosphorus": latest_data.soil_phosphorus,
+            "potassium": latest_data.soil_potassium
+        },
+        current_weather={
+            "temperature": latest_data.temperature,
+            "humidity": latest_data.humidity,
+            "rainfall": latest_data.rainfall
+        },
+        yield_forecast=yield_forecast,
+        recommendations=RecommendationResponse(**recommendations_data),
+        last_updated=latest_data.timestamp
+    )
+
 @router.get("/dashboard", response_model=DashboardResponse)
 async def get_dashboard(
     field_id: str = Query(default="field_001", description="Field identifier"),
@@ -24,38 +116,7 @@ async def get_dashboard(
         # Validate and sanitize input
         field_id = validate_field_id(field_id)
         
-        ai_service = AIService(db)
-        
-        # Get latest sensor data
-        latest_data = DataService.get_latest_sensor_data(db, field_id)
-        if not latest_data:
-            raise HTTPException(status_code=404, detail="No sensor data found for the specified field")
-        
-        # Get recommendations
-        recommendations_data = ai_service.generate_recommendations(field_id)
-        
-        # Get yield forecast
-        yield_forecast = recommendations_data["yield_forecast"]
-        
-        # Format response
-        dashboard = DashboardResponse(
-            current_soil_moisture=latest_data.soil_moisture,
-            current_nutrients={
-                "nitrogen": latest_data.soil_nitrogen,
-                "phosphorus": latest_data.soil_phosphorus,
-                "potassium": latest_data.soil_potassium
-            },
-            current_weather={
-                "temperature": latest_data.temperature,
-                "humidity": latest_data.humidity,
-                "rainfall": latest_data.rainfall
-            },
-            yield_forecast=yield_forecast,
-            recommendations=RecommendationResponse(**recommendations_data),
-            last_updated=latest_data.timestamp
-        )
-        
-        return dashboard
+        return await coalesce("dashboard", field_id, db, lambda session: build_dashboard(session, field_id))
     except HTTPException:
         raise
     except Exception as e:
@@ -71,9 +132,12 @@ async def get_recommendations(
         # Validate and sanitize input
         field_id = validate_field_id(field_id)
         
-        ai_service = AIService(db)
-        recommendations = ai_service.generate_recommendations(field_id)
-        return RecommendationResponse(**recommendations)
+        return await coalesce(
+            "recommendations",
+            field_id,
+            db,
+            lambda session: RecommendationResponse(**get_ai_service(session).generate_recommendations(field_id))
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -114,30 +178,59 @@ async def get_historical_data(
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to retrieve historical data")
 
-@router.get("/sensor-data", response_model=List[SensorDataResponse])
+@router.get("/historical/downsampled")
+async def get_downsampled_historical_data(
+    days: int = Query(default=30, ge=1, le=365, description="Number of days of historical data"),
+    bucket_hours: int = Query(default=24, ge=1, le=168, description="Bucket size in hours"),
+    field_id: str = Query(default="field_001", description="Field identifier"),
+    db: Session = Depends(get_db)
+):
+    """Get historical sensor data averaged into time buckets"""
+    try:
+        # Validate and sanitize inputs
+        field_id = validate_field_id(field_id)
+        days = validate_days(days)
+        
+        sensor_data = DataService.get_downsampled_sensor_data(
+            db, days=days, field_id=field_id, bucket_hours=bucket_hours
+        )
+        return {"bucket_hours": bucket_hours, "sensor_data": sensor_data}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Failed to retrieve downsampled data")
+
+@router.get("/sensor-data", response_model=SensorDataPage)
 async def get_sensor_data(
     days: int = Query(default=7, ge=1, le=365, description="Number of days of sensor data"),
     field_id: str = Query(default="field_001", description="Field identifier"),
+    limit: int = Query(default=500, ge=1, le=5000, description="Maximum readings per page"),
+    cursor: Optional[str] = Query(default=None, max_length=200, description="next_cursor from the previous page"),
     db: Session = Depends(get_db)
 ):
-    """Get sensor data for specified time period"""
+    """Get sensor data for specified time period, one page at a time"""
     try:
         # Validate and sanitize inputs
         field_id = validate_field_id(field_id)
         days = validate_days(days)
+        after = decode_cursor(cursor) if cursor else None
         
-        sensor_data = DataService.get_historical_sensor_data(db, days=days, field_id=field_id)
-        return [SensorDataResponse.model_validate(d) for d in sensor_data]
+        sensor_data, next_key = DataService.get_sensor_data_page(
+            db, days=days, field_id=field_id, limit=limit, after=after
+        )
+        return SensorDataPage(
+            sensor_data=[SensorDataResponse.model_validate(d) for d in sensor_data],
+            next_cursor=encode_cursor(next_key) if next_key else None
+        )
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to retrieve sensor data")
 
 @router.get("/weather-forecast")
-async def get_weather_forecast(db: Session = Depends(get_db)):
+async def get_weather_forecast(ai_service=Depends(get_ai_service)):
     """Get 7-day weather forecast"""
     try:
-        ai_service = AIService(db)
         forecast = ai_service.get_weather_forecast()
         return {"forecast": forecast}
     except Exception as e:
@@ -0,0 +1,86 @@
+"""
+Compare ORM entity reads with read-only SensorReading records.
+
+Loads N generated readings into a temporary SQLite database and reports the
+time and allocated memory per row of each read path.
+
+Example:
+    python benchmark_reads.py --rows 100000
+"""
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models import SensorData, SensorReading, SENSOR_READING_COLUMNS
+from services.data_generator import SyntheticDataGenerator
+
+
+def read_orm(db):
+    return db.query(SensorData).order_by(SensorData.timestamp.asc()).all()
+
+
+def read_records(db):
+    rows = db.query(*SENSOR_READING_COLUMNS).order_by(SensorData.timestamp.asc()).all()
+    return list(map(SensorReading._make, rows))
+
+
+def measure(session_factory, read, repeat: int):
+    """Best wall time and peak traced memory of one read with a fresh session"""
+    best = float("inf")
+    for _ in range(repeat):
+        db = session_factory()
+        gc.collect()
+        started = time.perf_counter()
+        result = read(db)
+        best = min(best, time.perf_counter() - started)
+        del result
+        db.close()
+
+    db = session_factory()
+    gc.collect()
+    tracemalloc.start()
+    result = read(db)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rows = len(result)
+    del result
+    db.close()
+    return rows, best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sensor data read paths")
+    parser.add_argument("--rows", type=int, default=100_000, help="Number of readings to load")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        interval_minutes = 5
+        days = -(-args.rows * interval_minutes // 1440)
+        SyntheticDataGenerator(days=days, interval_minutes=interval_minutes).write_db(engine)
+        session_factory = sessionmaker(bind=engine)
+
+        results = {}
+        for name, read in (("orm", read_orm), ("records", read_records)):
+            rows, seconds, peak = measure(session_factory, read, args.repeat)
+            results[name] = (seconds, peak)
+            print(
+                f"{name:>8}: {rows:,} rows in {seconds * 1000:.0f} ms "
+                f"({seconds / rows * 1e6:.2f} us/row), peak {peak / 2**20:.1f} MiB "
+                f"({peak / rows:.0f} B/row)"
+            )
+
+        orm, records = results["orm"], results["records"]
+        print(f"speedup {orm[0] / records[0]:.1f}x, memory {orm[1] / records[1]:.1f}x smaller")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
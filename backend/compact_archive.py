@@ -0,0 +1,37 @@
+"""
+Move sensor readings older than the hot window into the memory-mapped archive.
+
+Example:
+    python compact_archive.py --older-than-days 90
+"""
+import argparse
+import time
+
+from database import SessionLocal, init_db
+from services.archive_service import MIN_HOT_DAYS, ArchiveCompactor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact cold sensor history into the archive")
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=90,
+        help=f"Archive readings older than this (at least {MIN_HOT_DAYS})",
+    )
+    args = parser.parse_args()
+    if args.older_than_days < MIN_HOT_DAYS:
+        parser.error(f"--older-than-days must be at least {MIN_HOT_DAYS}")
+
+    init_db()
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        moved = ArchiveCompactor(db).compact(older_than_days=args.older_than_days)
+        print(f"Archived {moved:,} readings in {time.perf_counter() - started:.1f}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, Boolean
+from sqlalchemy import create_engine, inspect, Column, Integer, Float, String, DateTime, Boolean
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
@@ -7,6 +7,9 @@ import os
 # SQLite database
 DATABASE_URL = "sqlite:///./agriculture.db"
 
+# Memory-mapped archive of cold sensor history (see services/archive_service.py)
+ARCHIVE_DIR = os.getenv("SENSOR_ARCHIVE_DIR", "./archive")
+
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -15,6 +18,33 @@ def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
 
+def bootstrap_db(seed: bool = True):
+    """One-time startup step: create missing tables and seed an empty database.
+
+    Skips schema creation when every table already exists and skips seeding
+    when sensor data or an archive is present, so warm restarts do no extra
+    work. Indexes
+    added to an existing table are created in place.
+    """
+    import models  # noqa: F401  (registers tables on Base.metadata)
+
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    if not set(Base.metadata.tables).issubset(existing_tables):
+        init_db()
+    else:
+        for table in Base.metadata.sorted_tables:
+            existing_indexes = {ix["name"] for ix in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(bind=engine)
+
+    if seed:
+        from services.data_service import DataService
+        # After compaction an empty sensor_data table is valid; don't seed over an archive
+        if DataService.get_archive() is None:
+            DataService.seed_mock_data()
+
 def get_db():
     """Get database session"""
     db = SessionLocal()
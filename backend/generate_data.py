@@ -0,0 +1,73 @@
+"""
+Generate synthetic sensor data for load testing.
+
+Examples:
+    python generate_data.py --fields 100 --days 365 --interval-minutes 15 --output db --recent
+    python generate_data.py --fields 1000 --days 365 --interval-minutes 5 --output parquet --path readings.parquet
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from services.data_generator import DEFAULT_START, SyntheticDataGenerator
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate synthetic sensor readings")
+    parser.add_argument("--fields", type=int, default=1, help="Number of fields")
+    parser.add_argument("--days", type=int, default=30, help="Days of history per field")
+    parser.add_argument("--interval-minutes", type=float, default=360, help="Minutes between readings")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    start = parser.add_mutually_exclusive_group()
+    start.add_argument(
+        "--start",
+        type=datetime.fromisoformat,
+        default=None,
+        help=f"First timestamp (ISO format, UTC); defaults to {DEFAULT_START.date()}",
+    )
+    start.add_argument(
+        "--recent",
+        action="store_true",
+        help="Start at midnight `days` ago so the data falls in the API's recent windows "
+             "(timestamps then differ between runs)",
+    )
+    parser.add_argument("--output", choices=["db", "csv", "parquet"], default="db")
+    parser.add_argument("--path", help="Output file for csv/parquet")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.output != "db" and not args.path:
+        raise SystemExit("--path is required for csv and parquet output")
+
+    if args.recent:
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        args.start = today - timedelta(days=args.days)
+
+    try:
+        generator = SyntheticDataGenerator(
+            num_fields=args.fields,
+            days=args.days,
+            interval_minutes=args.interval_minutes,
+            seed=args.seed,
+            start=args.start,
+        )
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print(f"Generating {generator.total_readings:,} readings ({args.output})...")
+
+    started = time.perf_counter()
+    if args.output == "db":
+        written = generator.write_db()
+    elif args.output == "csv":
+        written = generator.write_csv(args.path)
+    else:
+        written = generator.write_parquet(args.path)
+    elapsed = time.perf_counter() - started
+
+    print(f"Wrote {written:,} readings in {elapsed:.1f}s ({written / max(elapsed, 1e-9):,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime, Boolean
+from sqlalchemy import Column, Index, Integer, Float, String, DateTime, Boolean
 from database import Base
 from datetime import datetime
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, NamedTuple
 
 # SQLAlchemy Models
 class SensorData(Base):
@@ -18,6 +18,14 @@ class SensorData(Base):
     humidity = Column(Float)  # Percentage
     rainfall = Column(Float)  # mm
     field_id = Column(String, default="field_001")
+    
+    # Serves per-field time-range scans and (timestamp, id) keyset paging;
+    # SQLite appends the integer primary key to every index entry.
+    # AUTOINCREMENT stops SQLite reusing ids of rows compaction moved to the archive
+    __table_args__ = (
+        Index("ix_sensor_data_field_timestamp", "field_id", "timestamp"),
+        {"sqlite_autoincrement": True},
+    )
 
 class YieldHistory(Base):
     __tablename__ = "yield_history"
@@ -29,6 +37,28 @@ class YieldHistory(Base):
     field_id = Column(String, default="field_001")
     harvest_date = Column(DateTime, default=datetime.utcnow)
 
+# Read-only records (plain column tuples, not tracked by the session)
+class SensorReading(NamedTuple):
+    id: int
+    timestamp: datetime
+    soil_moisture: float
+    soil_nitrogen: float
+    soil_phosphorus: float
+    soil_potassium: float
+    temperature: float
+    humidity: float
+    rainfall: float
+    field_id: str
+
+class YieldRecord(NamedTuple):
+    season: str
+    crop_type: str
+    yield_amount: float
+    harvest_date: datetime
+
+SENSOR_READING_COLUMNS = [getattr(SensorData, name) for name in SensorReading._fields]
+YIELD_RECORD_COLUMNS = [getattr(YieldHistory, name) for name in YieldRecord._fields]
+
 # Pydantic Models for API
 class SensorDataResponse(BaseModel):
     id: int
@@ -45,6 +75,10 @@ class SensorDataResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class SensorDataPage(BaseModel):
+    sensor_data: List[SensorDataResponse]
+    next_cursor: Optional[str] = None  # None on the last page
+
 class RecommendationResponse(BaseModel):
     irrigation: str  # Low, Medium, High
     fertilizer: str  # Apply, Delay
@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 from typing import List, Dict
 import numpy as np
 from sqlalchemy.orm import Session
-from models import SensorData, YieldHistory
+from models import SensorData, YieldHistory, SensorReading, SENSOR_READING_COLUMNS
 import random
 
 class AIService:
@@ -18,12 +18,13 @@ class AIService:
     def __init__(self, db: Session):
         self.db = db
     
-    def get_recent_sensor_data(self, days: int = 7) -> List[SensorData]:
+    def get_recent_sensor_data(self, days: int = 7) -> List[SensorReading]:
         """Get recent sensor data"""
         cutoff = datetime.utcnow() - timedelta(days=days)
-        return self.db.query(SensorData).filter(
+        rows = self.db.query(*SENSOR_READING_COLUMNS).filter(
             SensorData.timestamp >= cutoff
         ).order_by(SensorData.timestamp.desc()).all()
+        return list(map(SensorReading._make, rows))
     
     def get_weather_forecast(self) -> Dict:
         """Simulate weather forecast for next 7 days"""
@@ -46,7 +47,7 @@ class AIService:
         
         return forecast
     
-    def predict_irrigation_need(self, current_data: SensorData, forecast: List[Dict]) -> str:
+    def predict_irrigation_need(self, current_data: SensorReading, forecast: List[Dict]) -> str:
         """Predict irrigation recommendation"""
         moisture = current_data.soil_moisture
         
@@ -66,7 +67,7 @@ class AIService:
         else:
             return "Low"
     
-    def predict_fertilizer_need(self, recent_data: List[SensorData]) -> str:
+    def predict_fertilizer_need(self, recent_data: List[SensorReading]) -> str:
         """Predict fertilizer recommendation based on nutrient trends"""
         if len(recent_data) < 3:
             return "Delay"
@@ -99,7 +100,7 @@ class AIService:
         else:
             return "Delay"
     
-    def predict_pest_risk(self, current_data: SensorData, forecast: List[Dict]) -> str:
+    def predict_pest_risk(self, current_data: SensorReading, forecast: List[Dict]) -> str:
         """Predict pest risk based on temperature and humidity"""
         current_temp = current_data.temperature
         current_humidity = current_data.humidity
@@ -123,16 +124,14 @@ class AIService:
     def forecast_yield(self, field_id: str = "field_001") -> float:
         """Forecast yield using moving average and trend"""
         # Get historical yields
-        yield_history = self.db.query(YieldHistory).filter(
+        yields = [row.yield_amount for row in self.db.query(YieldHistory.yield_amount).filter(
             YieldHistory.field_id == field_id
-        ).order_by(YieldHistory.harvest_date.desc()).limit(5).all()
+        ).order_by(YieldHistory.harvest_date.desc()).limit(5).all()]
         
-        if not yield_history:
+        if not yields:
             # Default forecast if no history
             return 8.5
         
-        yields = [y.yield_amount for y in yield_history]
-        
         # Weighted moving average (more recent = higher weight)
         weights = np.array([0.4, 0.3, 0.2, 0.08, 0.02][:len(yields)])
         weights = weights / weights.sum()  # Normalize
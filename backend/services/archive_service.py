@@ -0,0 +1,300 @@
+"""
+Memory-mapped binary archive for cold sensor history.
+
+Layout of an archive version directory:
+    id.i64, timestamp.i64      int64 row ids and timestamps (UTC microseconds)
+    <metric>.f32               one float32 column file per metric
+    index.json                 per-field (offset, count) into the columns
+
+Rows are stored contiguously per field and sorted by timestamp, so a field's
+time range is a zero-copy slice of each memory-mapped column. ``CURRENT``
+in the archive root names the live version and is swapped atomically by
+compaction.
+"""
+import json
+import os
+import shutil
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from database import ARCHIVE_DIR
+from models import SensorData, SensorReading
+
+METRIC_COLUMNS = [
+    "soil_moisture",
+    "soil_nitrogen",
+    "soil_phosphorus",
+    "soil_potassium",
+    "temperature",
+    "humidity",
+    "rainfall",
+]
+
+# Compaction must leave at least this many days in the database: the latest
+# reading and AIService's recent-data window are read from SQLite only
+MIN_HOT_DAYS = 7
+
+# Ids per DELETE ... IN (...), below SQLite's bound-parameter limit
+DELETE_BATCH_SIZE = 500
+
+_EPOCH = datetime(1970, 1, 1)
+_cache: Dict[str, Tuple[str, "SensorArchive"]] = {}
+
+
+def to_micros(value: datetime) -> int:
+    """Naive UTC datetime -> microseconds since the epoch"""
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(value))
+
+
+def widen(values: np.ndarray) -> np.ndarray:
+    """float32 column -> float64, rounded to 4 decimals.
+
+    Archived values keep float32 precision (~7 significant digits) and are
+    rounded to 4 decimals on the way out; e.g. 1234.5678 reads back as
+    1234.5677 and 0.123456 as 0.1235. Values with at most 2 decimals and
+    magnitude below 10^4, like the sensor readings, read back unchanged.
+    """
+    return np.round(values.astype(np.float64), 4)
+
+
+def _row_keys(ids: np.ndarray, timestamps: np.ndarray) -> np.ndarray:
+    """One opaque 16-byte key per (id, timestamp) pair, comparable with np.isin"""
+    pairs = np.ascontiguousarray(np.stack((ids, timestamps), axis=1))
+    return pairs.view(np.dtype((np.void, pairs.dtype.itemsize * 2))).ravel()
+
+
+def _fsync(f):
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _fsync_dir(path: str):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def downsample(timestamps: np.ndarray, columns: Dict[str, np.ndarray], bucket_seconds: int):
+    """Average sorted readings into fixed time buckets.
+
+    Returns the bucket start timestamps (microseconds) and per-column means.
+    """
+    if len(timestamps) == 0:
+        return np.empty(0, dtype=np.int64), {name: np.empty(0) for name in columns}
+
+    buckets = timestamps // (bucket_seconds * 1_000_000)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+    counts = np.diff(np.append(starts, len(timestamps)))
+    means = {
+        name: np.add.reduceat(values, starts, dtype=np.float64) / counts
+        for name, values in columns.items()
+    }
+    return buckets[starts] * bucket_seconds * 1_000_000, means
+
+
+class SensorArchive:
+    """Read-only view over one archive version via np.memmap"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "index.json")) as f:
+            index = json.load(f)
+        self.archived_until = datetime.fromisoformat(index["archived_until"])
+        self.fields: Dict[str, Tuple[int, int]] = {k: tuple(v) for k, v in index["fields"].items()}
+        self.row_count = index["row_count"]
+
+        self.ids = self._map("id.i64", np.int64)
+        self.timestamps = self._map("timestamp.i64", np.int64)
+        self.columns = {name: self._map(f"{name}.f32", np.float32) for name in METRIC_COLUMNS}
+
+    def _map(self, filename: str, dtype) -> np.ndarray:
+        if self.row_count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(os.path.join(self.path, filename), dtype=dtype, mode="r", shape=(self.row_count,))
+
+    @classmethod
+    def load(cls, root: str = ARCHIVE_DIR) -> Optional["SensorArchive"]:
+        """Open the live archive version, or None if nothing has been archived"""
+        try:
+            with open(os.path.join(root, "CURRENT")) as f:
+                version = f.read().strip()
+        except FileNotFoundError:
+            return None
+
+        cached = _cache.get(root)
+        if cached and cached[0] == version:
+            return cached[1]
+        archive = cls(os.path.join(root, version))
+        _cache[root] = (version, archive)
+        return archive
+
+    def field_slice(
+        self,
+        field_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Zero-copy column views for a field in [start, end)"""
+        offset, count = self.fields.get(field_id, (0, 0))
+        timestamps = self.timestamps[offset:offset + count]
+        lo = np.searchsorted(timestamps, to_micros(start)) if start else 0
+        hi = np.searchsorted(timestamps, to_micros(end)) if end else count
+        lo, hi = offset + lo, offset + hi
+
+        result = {"id": self.ids[lo:hi], "timestamp": self.timestamps[lo:hi]}
+        for name, values in self.columns.items():
+            result[name] = values[lo:hi]
+        return result
+
+    def page(
+        self,
+        field_id: str,
+        limit: int,
+        start: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[SensorReading]:
+        """Up to `limit` readings ordered by (timestamp, id), strictly after the `after` key"""
+        offset, count = self.fields.get(field_id, (0, 0))
+        timestamps = self.timestamps[offset:offset + count]
+        lo = np.searchsorted(timestamps, to_micros(start)) if start else 0
+        if after:
+            after_ts = to_micros(after[0])
+            first = np.searchsorted(timestamps, after_ts, side="left")
+            last = np.searchsorted(timestamps, after_ts, side="right")
+            ids = self.ids[offset + first:offset + last]
+            lo = max(lo, first + np.searchsorted(ids, after[1], side="right"))
+        hi = min(lo + limit, count)
+        return self._readings(field_id, offset + lo, offset + hi)
+
+    def to_readings(self, field_id: str, start: Optional[datetime] = None) -> List[SensorReading]:
+        """Materialize archived rows as read-only SensorReading records"""
+        offset, count = self.fields.get(field_id, (0, 0))
+        lo = np.searchsorted(self.timestamps[offset:offset + count], to_micros(start)) if start else 0
+        return self._readings(field_id, offset + lo, offset + count)
+
+    def _readings(self, field_id: str, lo: int, hi: int) -> List[SensorReading]:
+        data = {"id": self.ids[lo:hi], "timestamp": self.timestamps[lo:hi]}
+        data.update({name: values[lo:hi] for name, values in self.columns.items()})
+        columns = [widen(data[name]).tolist() for name in METRIC_COLUMNS]
+        return [
+            SensorReading(row_id, from_micros(ts), *values, field_id)
+            for row_id, ts, *values in zip(data["id"].tolist(), data["timestamp"].tolist(), *columns)
+        ]
+
+
+class ArchiveCompactor:
+    """Move sensor readings older than the hot window into a new archive version"""
+
+    def __init__(self, db: Session, root: str = ARCHIVE_DIR):
+        self.db = db
+        self.root = root
+
+    def _hot_rows(self, field_id: str, cutoff: datetime) -> Dict[str, np.ndarray]:
+        rows = self.db.execute(
+            select(SensorData.id, SensorData.timestamp, *(getattr(SensorData, c) for c in METRIC_COLUMNS))
+            .where(SensorData.field_id == field_id, SensorData.timestamp < cutoff)
+            .order_by(SensorData.timestamp.asc(), SensorData.id.asc())
+        ).all()
+        ids, timestamps, *metrics = list(zip(*rows)) or [()] * (2 + len(METRIC_COLUMNS))
+        result = {
+            "id": np.array(ids, dtype=np.int64),
+            "timestamp": np.array(timestamps, dtype="datetime64[us]").astype(np.int64),
+        }
+        for name, values in zip(METRIC_COLUMNS, metrics):
+            result[name] = np.array(values, dtype=np.float32)
+        return result
+
+    def compact(self, older_than_days: int = 90) -> int:
+        """Archive readings older than the cutoff and delete them from the database.
+
+        Returns the number of rows moved out of the database.
+        """
+        if older_than_days < MIN_HOT_DAYS:
+            raise ValueError(f"older_than_days must be at least {MIN_HOT_DAYS}")
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+        previous = SensorArchive.load(self.root)
+        if previous and previous.archived_until >= cutoff:
+            return 0
+
+        version = f"v{datetime.utcnow():%Y%m%d%H%M%S%f}"
+        path = os.path.join(self.root, version)
+        os.makedirs(path)
+
+        db_fields = self.db.execute(
+            select(SensorData.field_id).where(SensorData.timestamp < cutoff).distinct()
+        ).scalars().all()
+        field_ids = sorted(set(db_fields) | set(previous.fields if previous else ()))
+
+        names = ["id", "timestamp"] + METRIC_COLUMNS
+        files = {
+            name: open(os.path.join(path, f"{name}.i64" if name in ("id", "timestamp") else f"{name}.f32"), "wb")
+            for name in names
+        }
+        index, offset, moved = {}, 0, 0
+        try:
+            for field_id in field_ids:
+                hot = self._hot_rows(field_id, cutoff)
+                moved += len(hot["id"])
+                if previous:
+                    # A run that crashed after publishing but before committing its
+                    # delete leaves rows in both tiers; keep the database copy.
+                    # Match on (id, timestamp): databases created before AUTOINCREMENT
+                    # reuse the ids of archived rows
+                    cold = previous.field_slice(field_id)
+                    keep = ~np.isin(
+                        _row_keys(cold["id"], cold["timestamp"]),
+                        _row_keys(hot["id"], hot["timestamp"])
+                    )
+                    merged = {name: np.concatenate((cold[name][keep], hot[name])) for name in names}
+                    order = np.lexsort((merged["id"], merged["timestamp"]))
+                    merged = {name: values[order] for name, values in merged.items()}
+                else:
+                    merged = hot
+                count = len(merged["id"])
+                for name in names:
+                    merged[name].tofile(files[name])
+                index[field_id] = [offset, count]
+                offset += count
+
+                # Delete exactly the rows just archived, in the transaction that read them;
+                # rows inserted since the read stay in the database for the next run
+                hot_ids = hot["id"].tolist()
+                for i in range(0, len(hot_ids), DELETE_BATCH_SIZE):
+                    self.db.execute(
+                        delete(SensorData).where(SensorData.id.in_(hot_ids[i:i + DELETE_BATCH_SIZE]))
+                    )
+            for f in files.values():
+                _fsync(f)
+        finally:
+            for f in files.values():
+                f.close()
+
+        with open(os.path.join(path, "index.json"), "w") as f:
+            json.dump({"archived_until": cutoff.isoformat(), "row_count": offset, "fields": index}, f)
+            _fsync(f)
+        _fsync_dir(path)
+
+        # Publish the new version once it is durable, then commit the deletes.
+        # Readers only query the database from archived_until on, so rows left
+        # behind by a failed commit are never served twice
+        pointer = os.path.join(self.root, "CURRENT.tmp")
+        with open(pointer, "w") as f:
+            f.write(version)
+            _fsync(f)
+        os.replace(pointer, os.path.join(self.root, "CURRENT"))
+        _fsync_dir(self.root)
+        self.db.commit()
+
+        if previous:
+            shutil.rmtree(previous.path, ignore_errors=True)
+        return moved
@@ -0,0 +1,238 @@
+"""
+Vectorized, seeded synthetic sensor data generator for large-scale testing
+"""
+import csv
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+# Column order shared by every output format
+SENSOR_COLUMNS = [
+    "timestamp",
+    "soil_moisture",
+    "soil_nitrogen",
+    "soil_phosphorus",
+    "soil_potassium",
+    "temperature",
+    "humidity",
+    "rainfall",
+    "field_id",
+]
+METRIC_COLUMNS = SENSOR_COLUMNS[1:-1]
+
+# Readings generated per chunk; also the unit of RNG seeding, so the output
+# is identical no matter how the chunks are consumed
+BLOCK_SIZE = 1 << 16
+
+# Fixed default first timestamp, so runs without an explicit start reproduce
+DEFAULT_START = datetime(2024, 1, 1)
+
+
+class SyntheticDataGenerator:
+    """Generate N fields x M days of sensor readings with NumPy.
+
+    Each field has its own baseline, trends, diurnal and weekly temperature
+    cycles, random rain events and nutrient depletion between fertilizer
+    applications. Every block of readings draws from a random stream derived
+    from (seed, field, block), so the same seed and start always produce the
+    same data. `start` defaults to DEFAULT_START.
+    """
+
+    RAIN_EVENTS_PER_DAY = 0.15
+    FERTILIZER_PERIOD_DAYS = 60.0
+
+    def __init__(
+        self,
+        num_fields: int = 1,
+        days: int = 30,
+        interval_minutes: float = 360,
+        seed: int = 42,
+        start: Optional[datetime] = None,
+    ):
+        if num_fields < 1 or days < 1 or interval_minutes <= 0:
+            raise ValueError("num_fields, days and interval_minutes must be positive")
+        self.step_seconds = int(round(interval_minutes * 60))
+        if self.step_seconds < 1:
+            raise ValueError("interval_minutes must be at least one second")
+
+        self.num_fields = num_fields
+        self.days = days
+        self.interval_minutes = interval_minutes
+        self.seed = seed
+        self.start = start or DEFAULT_START
+
+        self.readings_per_field = int(days * 86400 // self.step_seconds)
+
+    @property
+    def total_readings(self) -> int:
+        return self.num_fields * self.readings_per_field
+
+    @staticmethod
+    def field_name(index: int) -> str:
+        return f"field_{index + 1:03d}"
+
+    def _field_params(self, field_index: int) -> Dict[str, float]:
+        """Per-field baselines and trend rates"""
+        rng = np.random.default_rng([self.seed, field_index])
+        return {
+            "base_temp": rng.normal(22, 2),
+            "base_moisture": rng.uniform(35, 50),
+            "moisture_trend": rng.normal(0, 2),  # % per year
+            "base_nitrogen": rng.uniform(25, 35),
+            "base_phosphorus": rng.uniform(18, 26),
+            "base_potassium": rng.uniform(190, 240),
+            "nitrogen_depletion": rng.uniform(0.1, 0.25),  # ppm per day
+            "phosphorus_depletion": rng.uniform(0.05, 0.12),
+            "potassium_depletion": rng.uniform(0.3, 0.8),
+            "fertilizer_phase": rng.uniform(0, self.FERTILIZER_PERIOD_DAYS),
+        }
+
+    def iter_chunks(self) -> Iterator[Dict[str, np.ndarray]]:
+        """Yield column arrays for up to BLOCK_SIZE readings of one field at a time"""
+        start64 = np.datetime64(self.start, "s")
+        start_day_of_year = self.start.timetuple().tm_yday - 1
+        start_hour = self.start.hour + self.start.minute / 60 + self.start.second / 3600
+        step_hours = self.step_seconds / 3600
+        rain_probability = min(self.RAIN_EVENTS_PER_DAY * step_hours / 24, 1.0)
+
+        for field_index in range(self.num_fields):
+            p = self._field_params(field_index)
+            field_id = self.field_name(field_index)
+            # Steps since the last rain event and its amount, carried across blocks
+            steps_since_rain = np.inf
+            last_rain_amount = 0.0
+
+            for block_index, offset in enumerate(range(0, self.readings_per_field, BLOCK_SIZE)):
+                n = min(BLOCK_SIZE, self.readings_per_field - offset)
+                rng = np.random.default_rng([self.seed, field_index, block_index])
+                steps = np.arange(offset, offset + n, dtype=np.int64)
+                elapsed_days = steps * (step_hours / 24)
+                hour = (start_hour + steps * step_hours) % 24
+                day_of_year = (start_day_of_year + elapsed_days) % 365.25
+
+                # Rain events and time since the most recent one
+                is_rain = rng.random(n) < rain_probability
+                rainfall = np.where(is_rain, rng.gamma(2.0, 3.0, n), 0.0)
+                local = np.arange(n)
+                last_rain = np.maximum.accumulate(np.where(is_rain, local, -1))
+                has_rain = last_rain >= 0
+                since = np.where(has_rain, local - last_rain, local + steps_since_rain)
+                amount = np.where(has_rain, rainfall[np.maximum(last_rain, 0)], last_rain_amount)
+                hours_since_rain = since * step_hours
+                wet_short = np.exp(-hours_since_rain / 24) * np.minimum(amount / 10, 1)
+                wet_long = np.exp(-hours_since_rain / 72) * np.minimum(amount / 10, 1)
+                if has_rain[-1]:
+                    steps_since_rain = n - last_rain[-1]
+                    last_rain_amount = rainfall[last_rain[-1]]
+                else:
+                    steps_since_rain += n
+
+                seasonal = np.sin(2 * np.pi * (day_of_year - 110) / 365.25)
+                diurnal = np.sin(2 * np.pi * (hour - 9) / 24)  # peaks at 15:00
+                weekly = np.sin(2 * np.pi * elapsed_days / 7)
+
+                temperature = (
+                    p["base_temp"] + 8 * seasonal + 5 * diurnal + 2 * weekly
+                    - 2 * wet_short + rng.normal(0, 1, n)
+                )
+                humidity = np.clip(
+                    62 - 10 * diurnal + 20 * wet_short + rng.normal(0, 4, n), 10, 100
+                )
+                soil_moisture = np.clip(
+                    p["base_moisture"] - 8 * seasonal - 1.5 * diurnal + 25 * wet_long
+                    + p["moisture_trend"] * elapsed_days / 365.25 + rng.normal(0, 1.5, n),
+                    5, 95,
+                )
+
+                # Nutrients deplete linearly and reset at each fertilizer application
+                since_fertilizer = (elapsed_days + p["fertilizer_phase"]) % self.FERTILIZER_PERIOD_DAYS
+                soil_nitrogen = np.maximum(
+                    p["base_nitrogen"] - p["nitrogen_depletion"] * since_fertilizer + rng.normal(0, 1, n), 0
+                )
+                soil_phosphorus = np.maximum(
+                    p["base_phosphorus"] - p["phosphorus_depletion"] * since_fertilizer + rng.normal(0, 0.8, n), 0
+                )
+                soil_potassium = np.maximum(
+                    p["base_potassium"] - p["potassium_depletion"] * since_fertilizer + rng.normal(0, 5, n), 0
+                )
+
+                yield {
+                    "timestamp": start64 + steps * self.step_seconds,
+                    "soil_moisture": np.round(soil_moisture, 2),
+                    "soil_nitrogen": np.round(soil_nitrogen, 2),
+                    "soil_phosphorus": np.round(soil_phosphorus, 2),
+                    "soil_potassium": np.round(soil_potassium, 2),
+                    "temperature": np.round(temperature, 2),
+                    "humidity": np.round(humidity, 2),
+                    "rainfall": np.round(rainfall, 2),
+                    "field_id": field_id,
+                }
+
+    @staticmethod
+    def _timestamp_strings(timestamps: np.ndarray) -> np.ndarray:
+        """Format timestamps the way SQLAlchemy stores DateTime in SQLite"""
+        return np.char.replace(np.datetime_as_string(timestamps, unit="us"), "T", " ")
+
+    def write_db(self, engine=None) -> int:
+        """Bulk-insert all readings into the sensor_data table in one transaction"""
+        from database import Base, engine as default_engine
+        from models import SensorData
+
+        engine = engine or default_engine
+        Base.metadata.create_all(bind=engine)
+        columns = ", ".join(SENSOR_COLUMNS)
+        placeholders = ", ".join("?" for _ in SENSOR_COLUMNS)
+        statement = f"INSERT INTO {SensorData.__tablename__} ({columns}) VALUES ({placeholders})"
+
+        written = 0
+        with engine.begin() as conn:
+            for chunk in self.iter_chunks():
+                n = len(chunk["timestamp"])
+                rows = zip(
+                    self._timestamp_strings(chunk["timestamp"]).tolist(),
+                    *(chunk[name].tolist() for name in METRIC_COLUMNS),
+                    [chunk["field_id"]] * n,
+                )
+                conn.exec_driver_sql(statement, list(rows))
+                written += n
+        return written
+
+    def write_csv(self, path: str) -> int:
+        """Write all readings to a CSV file with a header row"""
+        written = 0
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(SENSOR_COLUMNS)
+            for chunk in self.iter_chunks():
+                n = len(chunk["timestamp"])
+                writer.writerows(zip(
+                    np.datetime_as_string(chunk["timestamp"], unit="s").tolist(),
+                    *(chunk[name].tolist() for name in METRIC_COLUMNS),
+                    [chunk["field_id"]] * n,
+                ))
+                written += n
+        return written
+
+    def write_parquet(self, path: str) -> int:
+        """Write all readings to a Parquet file (requires pyarrow)"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Parquet output requires pyarrow: pip install pyarrow") from e
+
+        schema = pa.schema(
+            [("timestamp", pa.timestamp("s"))]
+            + [(name, pa.float64()) for name in METRIC_COLUMNS]
+            + [("field_id", pa.string())]
+        )
+        written = 0
+        with pq.ParquetWriter(path, schema) as writer:
+            for chunk in self.iter_chunks():
+                n = len(chunk["timestamp"])
+                columns = {name: chunk[name] for name in SENSOR_COLUMNS[:-1]}
+                columns["field_id"] = pa.array([chunk["field_id"]] * n, pa.string())
+                writer.write_table(pa.table(columns, schema=schema))
+                written += n
+        return written
@@ -1,9 +1,19 @@
 from datetime import datetime, timedelta
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
-from database import SessionLocal
-from models import SensorData, YieldHistory
+from database import ARCHIVE_DIR, SessionLocal
+from models import (
+    SensorData,
+    YieldHistory,
+    SensorReading,
+    YieldRecord,
+    SENSOR_READING_COLUMNS,
+    YIELD_RECORD_COLUMNS
+)
+import math
+import os
 import random
-import numpy as np
+from typing import Optional, Tuple
 
 class DataService:
     """Service for managing sensor data and historical records"""
@@ -31,7 +41,7 @@ class DataService:
                     soil_nitrogen = 25 + random.uniform(-5, 10)
                     soil_phosphorus = 18 + random.uniform(-3, 8)
                     soil_potassium = 200 + random.uniform(-30, 50)
-                    temperature = 22 + random.uniform(-5, 8) + (5 * np.sin(day / 7))  # Weekly cycle
+                    temperature = 22 + random.uniform(-5, 8) + (5 * math.sin(day / 7))  # Weekly cycle
                     humidity = 60 + random.uniform(-15, 20)
                     rainfall = random.uniform(0, 10) if random.random() > 0.85 else 0
                     
@@ -71,25 +81,129 @@ class DataService:
             db.close()
     
     @staticmethod
-    def get_latest_sensor_data(db: Session, field_id: str = "field_001") -> SensorData:
+    def get_archive():
+        """Open the cold-history archive, importing numpy only if one exists"""
+        if not os.path.exists(os.path.join(ARCHIVE_DIR, "CURRENT")):
+            return None
+        from services.archive_service import SensorArchive
+        return SensorArchive.load(ARCHIVE_DIR)
+    
+    @staticmethod
+    def get_data_version(db: Session) -> tuple:
+        """Highest sensor and yield row ids; changes whenever new data lands.
+
+        Only used to key in-flight computations, never a cache. With
+        AUTOINCREMENT it only increases; databases created before that can
+        reuse ids after the newest rows are deleted, so a version may repeat.
+        """
+        return (
+            db.query(func.max(SensorData.id)).scalar(),
+            db.query(func.max(YieldHistory.id)).scalar()
+        )
+    
+    @staticmethod
+    def get_latest_sensor_data(db: Session, field_id: str = "field_001") -> SensorReading:
         """Get the most recent sensor reading"""
-        return db.query(SensorData).filter(
+        row = db.query(*SENSOR_READING_COLUMNS).filter(
             SensorData.field_id == field_id
         ).order_by(SensorData.timestamp.desc()).first()
+        return SensorReading._make(row) if row else None
     
     @staticmethod
     def get_historical_sensor_data(db: Session, days: int = 30, field_id: str = "field_001") -> list:
-        """Get historical sensor data"""
+        """Get historical sensor data, reading archived days from the archive"""
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        archived = []
+        archive = DataService.get_archive()
+        if archive and cutoff < archive.archived_until:
+            archived = archive.to_readings(field_id, start=cutoff)
+            cutoff = archive.archived_until
+        rows = db.query(*SENSOR_READING_COLUMNS).filter(
+            SensorData.field_id == field_id,
+            SensorData.timestamp >= cutoff
+        ).order_by(SensorData.timestamp.asc()).all()
+        return archived + list(map(SensorReading._make, rows))
+    
+    @staticmethod
+    def get_sensor_data_page(db: Session, days: int = 7, field_id: str = "field_001", limit: int = 500,
+                             after: Optional[Tuple[datetime, int]] = None) -> tuple:
+        """Get one page of sensor data ordered by (timestamp, id).
+
+        `after` is the (timestamp, id) key of the previous page's last row.
+        Returns the page and the key to resume from, or None on the last page.
+        """
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        readings = []
+        archive = DataService.get_archive()
+        if archive and cutoff < archive.archived_until:
+            if after is None or after[0] < archive.archived_until:
+                readings = archive.page(field_id, limit + 1, start=cutoff, after=after)
+            cutoff = archive.archived_until
+        
+        if len(readings) <= limit:
+            query = db.query(*SENSOR_READING_COLUMNS).filter(
+                SensorData.field_id == field_id,
+                SensorData.timestamp >= cutoff
+            )
+            if after:
+                # (timestamp, id) > after, phrased so the field/timestamp index bounds the scan
+                query = query.filter(
+                    SensorData.timestamp >= after[0],
+                    or_(SensorData.timestamp > after[0], SensorData.id > after[1])
+                )
+            rows = query.order_by(
+                SensorData.timestamp.asc(), SensorData.id.asc()
+            ).limit(limit + 1 - len(readings)).all()
+            readings += map(SensorReading._make, rows)
+        
+        if len(readings) <= limit:
+            return readings, None
+        readings = readings[:limit]
+        return readings, (readings[-1].timestamp, readings[-1].id)
+    
+    @staticmethod
+    def get_downsampled_sensor_data(db: Session, days: int = 30, field_id: str = "field_001",
+                                    bucket_hours: int = 24) -> list:
+        """Get sensor data averaged into fixed time buckets"""
+        import numpy as np
+        from services.archive_service import METRIC_COLUMNS, downsample, from_micros, widen
+        
         cutoff = datetime.utcnow() - timedelta(days=days)
-        return db.query(SensorData).filter(
+        parts = []
+        archive = DataService.get_archive()
+        if archive and cutoff < archive.archived_until:
+            archived = archive.field_slice(field_id, start=cutoff)
+            parts.append({
+                "timestamp": archived["timestamp"],
+                **{name: widen(archived[name]) for name in METRIC_COLUMNS}
+            })
+            cutoff = archive.archived_until
+        
+        rows = db.query(SensorData.timestamp, *(getattr(SensorData, c) for c in METRIC_COLUMNS)).filter(
             SensorData.field_id == field_id,
             SensorData.timestamp >= cutoff
         ).order_by(SensorData.timestamp.asc()).all()
+        if rows:
+            timestamps, *metrics = zip(*rows)
+            hot = {"timestamp": np.array(timestamps, dtype="datetime64[us]").astype(np.int64)}
+            hot.update({name: np.array(values, dtype=np.float64) for name, values in zip(METRIC_COLUMNS, metrics)})
+            parts.append(hot)
+        if not parts:
+            return []
+        
+        timestamps = np.concatenate([p["timestamp"] for p in parts])
+        columns = {name: np.concatenate([p[name] for p in parts]) for name in METRIC_COLUMNS}
+        buckets, means = downsample(timestamps, columns, bucket_hours * 3600)
+        return [
+            {"timestamp": from_micros(ts), **{name: round(float(means[name][i]), 2) for name in METRIC_COLUMNS}}
+            for i, ts in enumerate(buckets.tolist())
+        ]
     
     @staticmethod
     def get_yield_history(db: Session, field_id: str = "field_001") -> list:
         """Get yield history"""
-        return db.query(YieldHistory).filter(
+        rows = db.query(*YIELD_RECORD_COLUMNS).filter(
             YieldHistory.field_id == field_id
         ).order_by(YieldHistory.harvest_date.asc()).all()
+        return list(map(YieldRecord._make, rows))
 
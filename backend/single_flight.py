@@ -0,0 +1,47 @@
+"""
+Request coalescing (single-flight) for identical concurrent computations
+"""
+import asyncio
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+
+class SingleFlight:
+    """Share one in-flight computation among concurrent callers with the same key.
+
+    The first caller for a key starts the computation in the threadpool;
+    callers arriving while it runs await the same result. Exceptions reach
+    every waiter. Nothing is cached: the key is released as soon as the
+    computation finishes, so the next call recomputes.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """Run blocking `fn` once per key and return its result to every caller.
+
+        A caller that waits longer than `timeout` seconds gets
+        asyncio.TimeoutError. The shared computation keeps running for the
+        callers already waiting on it, but the key is released so new callers
+        start a fresh computation instead of joining one that may be hung.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(run_in_threadpool(fn))
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        try:
+            # Shield so a timed-out or disconnected caller does not cancel the others
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            if self._calls.get(key) is task:
+                del self._calls[key]
+            raise
+
+    def _release(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every waiter timed out
@@ -0,0 +1,44 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import Base  # noqa: E402
+import models  # noqa: E402,F401  (registers tables on Base.metadata)
+from services.data_generator import SyntheticDataGenerator  # noqa: E402
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def archive_root(tmp_path, monkeypatch):
+    """Point the read paths at an empty per-test archive directory"""
+    root = str(tmp_path / "archive")
+    monkeypatch.setattr("services.data_service.ARCHIVE_DIR", root)
+    return root
+
+
+@pytest.fixture
+def readings(engine):
+    """Two fields x 200 days of hourly readings ending today"""
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    generator = SyntheticDataGenerator(num_fields=2, days=200, interval_minutes=60, start=today - timedelta(days=200))
+    return generator.write_db(engine)
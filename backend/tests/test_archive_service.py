@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import numpy as np
+
+import database
+from models import SensorData
+from services.archive_service import ArchiveCompactor, SensorArchive, widen
+from services.data_service import DataService
+
+
+def test_compaction_moves_cold_rows_without_changing_reads(db, archive_root, readings):
+    # Generated readings have 2 decimals, which float32 archiving preserves
+    before = DataService.get_historical_sensor_data(db, days=200, field_id="field_002")
+
+    moved = ArchiveCompactor(db, archive_root).compact(older_than_days=90)
+
+    archive = SensorArchive.load(archive_root)
+    assert moved == archive.row_count > 0
+    assert db.query(SensorData).count() == readings - moved
+    assert db.query(SensorData).filter(SensorData.timestamp < archive.archived_until).count() == 0
+    assert DataService.get_historical_sensor_data(db, days=200, field_id="field_002") == before
+
+
+def test_downsampled_buckets_unchanged_by_compaction(db, archive_root, readings):
+    before = DataService.get_downsampled_sensor_data(db, days=200, field_id="field_001", bucket_hours=24)
+
+    ArchiveCompactor(db, archive_root).compact(older_than_days=90)
+
+    after = DataService.get_downsampled_sensor_data(db, days=200, field_id="field_001", bucket_hours=24)
+    assert after == before
+
+
+def test_failed_commit_does_not_duplicate_rows(db, archive_root, readings, monkeypatch):
+    compactor = ArchiveCompactor(db, archive_root)
+    original_commit = db.commit
+
+    def failing_commit():
+        raise RuntimeError("crash after publishing")
+
+    monkeypatch.setattr(db, "commit", failing_commit)
+    with pytest.raises(RuntimeError):
+        compactor.compact(older_than_days=90)
+    monkeypatch.setattr(db, "commit", original_commit)
+    db.rollback()
+
+    # The crashed run published an archive but the deletes were rolled back
+    assert db.query(SensorData).count() == readings
+    compactor.compact(older_than_days=60)
+
+    archive = SensorArchive.load(archive_root)
+    assert len(set(archive.ids.tolist())) == archive.row_count
+    assert archive.row_count + db.query(SensorData).count() == readings
+    readings_served = DataService.get_historical_sensor_data(db, days=200, field_id="field_001")
+    assert len({r.id for r in readings_served}) == len(readings_served)
+
+
+def test_rows_inserted_after_the_read_are_not_deleted(db, archive_root, readings, monkeypatch):
+    compactor = ArchiveCompactor(db, archive_root)
+    original_hot_rows = compactor._hot_rows
+    late = datetime.utcnow() - timedelta(days=150)
+
+    def hot_rows_then_insert(field_id, cutoff):
+        rows = original_hot_rows(field_id, cutoff)
+        db.add(SensorData(timestamp=late, field_id=field_id, soil_moisture=40.0))
+        db.flush()
+        return rows
+
+    monkeypatch.setattr(compactor, "_hot_rows", hot_rows_then_insert)
+    compactor.compact(older_than_days=90)
+
+    assert db.query(SensorData).filter(SensorData.timestamp == late).count() == 2
+
+
+def add_readings(db, ids, days_ago):
+    """Insert readings with explicit ids, one minute apart, starting `days_ago` days back"""
+    start = datetime.utcnow() - timedelta(days=days_ago)
+    db.add_all(
+        SensorData(id=row_id, timestamp=start + timedelta(minutes=i), field_id="field_001", soil_moisture=40.0)
+        for i, row_id in enumerate(ids)
+    )
+    db.commit()
+
+
+def test_reused_ids_do_not_replace_archived_rows(db, archive_root):
+    compactor = ArchiveCompactor(db, archive_root)
+    add_readings(db, range(1, 121), days_ago=30)
+    compactor.compact(older_than_days=20)
+
+    # Databases created before AUTOINCREMENT hand the same ids out again
+    add_readings(db, range(1, 121), days_ago=15)
+    compactor.compact(older_than_days=10)
+
+    archive = SensorArchive.load(archive_root)
+    assert archive.row_count == 240
+    assert db.query(SensorData).count() == 0
+
+
+def test_sensor_ids_are_never_reused(engine):
+    with engine.connect() as conn:
+        sql = conn.exec_driver_sql("SELECT sql FROM sqlite_master WHERE name = 'sensor_data'").scalar()
+    assert "AUTOINCREMENT" in sql
+
+
+def test_compaction_keeps_the_recent_window_in_the_database(db, archive_root):
+    with pytest.raises(ValueError):
+        ArchiveCompactor(db, archive_root).compact(older_than_days=6)
+
+
+def test_startup_does_not_seed_over_an_archive(engine, db, archive_root, monkeypatch):
+    add_readings(db, range(1, 11), days_ago=30)
+    ArchiveCompactor(db, archive_root).compact(older_than_days=20)
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr("services.data_service.SessionLocal", lambda: db)
+
+    database.bootstrap_db()
+
+    assert db.query(SensorData).count() == 0
+
+
+def test_widen_keeps_float32_precision():
+    values = np.array([1234.5678, 0.123456, 22.69], dtype=np.float32)
+    assert widen(values).tolist() == [1234.5677, 0.1235, 22.69]
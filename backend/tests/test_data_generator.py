@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from services.data_generator import SENSOR_COLUMNS, SyntheticDataGenerator
+
+
+def collect(generator):
+    """Concatenate every chunk into one array per column"""
+    chunks = list(generator.iter_chunks())
+    result = {
+        name: np.concatenate([chunk[name] for chunk in chunks]) for name in SENSOR_COLUMNS[:-1]
+    }
+    result["field_id"] = np.concatenate([np.full(len(chunk["timestamp"]), chunk["field_id"]) for chunk in chunks])
+    return result
+
+
+def make(seed, **kwargs):
+    # Two fields and more than one RNG block per field
+    return SyntheticDataGenerator(num_fields=2, days=80, interval_minutes=1, seed=seed, **kwargs)
+
+
+def test_same_seed_gives_identical_data():
+    first, second = collect(make(7)), collect(make(7))
+
+    for name in SENSOR_COLUMNS:
+        np.testing.assert_array_equal(first[name], second[name])
+
+
+def test_different_seed_gives_different_data():
+    first, second = collect(make(7)), collect(make(8))
+
+    np.testing.assert_array_equal(first["timestamp"], second["timestamp"])
+    assert not np.array_equal(first["temperature"], second["temperature"])
+    assert not np.array_equal(first["soil_moisture"], second["soil_moisture"])
+
+
+def test_default_start_is_fixed():
+    assert make(7).start == make(7, start=None).start == datetime(2024, 1, 1)
+
+
+def test_readings_per_field():
+    generator = SyntheticDataGenerator(num_fields=3, days=10, interval_minutes=15)
+
+    assert generator.readings_per_field == 10 * 96
+    assert generator.total_readings == 3 * 10 * 96
+    assert len(collect(generator)["timestamp"]) == generator.total_readings
+
+
+@pytest.mark.parametrize("interval_minutes", [0, -5, 1 / 240])
+def test_rejects_intervals_below_one_second(interval_minutes):
+    with pytest.raises(ValueError):
+        SyntheticDataGenerator(interval_minutes=interval_minutes)
@@ -0,0 +1,67 @@
+import base64
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from api.routes import decode_cursor, encode_cursor
+from models import SensorData
+from services.archive_service import ArchiveCompactor
+from services.data_service import DataService
+
+
+def walk(db, limit, **kwargs):
+    """Collect every page, returning the rows and the number of pages"""
+    rows, after, pages = [], None, 0
+    while True:
+        page, after = DataService.get_sensor_data_page(db, limit=limit, after=after, **kwargs)
+        rows += page
+        pages += 1
+        if after is None:
+            return rows, pages
+
+
+def test_cursor_round_trip():
+    key = (datetime(2026, 3, 1, 12, 30, 15, 123456), 42)
+    assert decode_cursor(encode_cursor(key)) == key
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    "Zm9v",
+    encode_cursor((datetime(2026, 1, 1), 1))[:-3],
+    base64.urlsafe_b64encode(b"2026-01-01T00:00:00+00:00|1").decode(),
+])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+def test_pages_cover_history_once_in_order(db, archive_root, readings):
+    expected = DataService.get_historical_sensor_data(db, days=150, field_id="field_001")
+
+    rows, pages = walk(db, 997, days=150, field_id="field_001")
+
+    assert rows == expected
+    assert pages == len(expected) // 997 + 1
+
+
+def test_pages_continue_from_archive_into_database(db, archive_root, readings):
+    expected = DataService.get_historical_sensor_data(db, days=150, field_id="field_002")
+    ArchiveCompactor(db, archive_root).compact(older_than_days=90)
+
+    rows, _ = walk(db, 997, days=150, field_id="field_002")
+
+    assert [(r.timestamp, r.id) for r in rows] == [(r.timestamp, r.id) for r in expected]
+
+
+def test_equal_timestamps_are_ordered_by_id(db, archive_root):
+    timestamp = datetime.utcnow() - timedelta(days=1)
+    db.add_all(SensorData(timestamp=timestamp, field_id="field_001", soil_moisture=float(i)) for i in range(5))
+    db.commit()
+
+    rows, pages = walk(db, 2, days=7, field_id="field_001")
+
+    assert [r.soil_moisture for r in rows] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert pages == 3
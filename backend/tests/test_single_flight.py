@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_computation():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"value": 42}
+
+    async def run():
+        flight = SingleFlight()
+        results = await asyncio.gather(*(flight.do("key", compute) for _ in range(20)))
+        return flight, results
+
+    flight, results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flight._calls == {}
+
+
+def test_different_keys_compute_separately():
+    async def run():
+        flight = SingleFlight()
+        return await asyncio.gather(flight.do("a", lambda: "a"), flight.do("b", lambda: "b"))
+
+    assert asyncio.run(run()) == ["a", "b"]
+
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    calls = []
+
+    def fail():
+        calls.append(1)
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    async def run():
+        flight = SingleFlight()
+        results = await asyncio.gather(*(flight.do("key", fail) for _ in range(5)), return_exceptions=True)
+        retry = await flight.do("key", lambda: "ok")
+        return results, retry
+
+    results, retry = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(calls) == 1
+    assert retry == "ok"
+
+
+def test_new_callers_do_not_join_a_flight_past_its_timeout():
+    release = threading.Event()
+
+    def hang():
+        release.wait(5)
+        return "stale"
+
+    async def run():
+        flight = SingleFlight()
+        with pytest.raises(asyncio.TimeoutError):
+            await flight.do("key", hang, timeout=0.05)
+        fresh = await flight.do("key", lambda: "fresh", timeout=0.5)
+        release.set()
+        return fresh
+
+    assert asyncio.run(run()) == "fresh"
+
+
+def test_coalesce_reads_the_data_version_off_the_event_loop(monkeypatch):
+    from api import routes
+
+    threads = []
+
+    class FakeSession:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    def get_data_version(db):
+        threads.append(threading.get_ident())
+        return (1, 1)
+
+    monkeypatch.setattr(routes.DataService, "get_data_version", staticmethod(get_data_version))
+    monkeypatch.setattr(routes, "SessionLocal", FakeSession)
+    db = FakeSession()
+
+    async def run():
+        return await routes.coalesce("dashboard", "field_001", db, lambda session: "built")
+
+    assert asyncio.run(run()) == "built"
+    assert threads and threads[0] != threading.get_ident()
+    assert db.closed